@@ -143,8 +143,8 @@ contract CfmmMathLibTest is Test {
         // forgefmt: disable-start
         _assertComputeSwap({tau: 0, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1100e18, expectedY: 900e18});
         _assertComputeSwap({tau: 0, bond: 200e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1200e18, expectedY: 800e18});
-        _assertComputeSwap({tau: 0, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 899.9999999999999e18, expectedY: 1100e18});
-        _assertComputeSwap({tau: 0, bond: -200e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 800.0000000000001e18, expectedY: 1200e18});
+        _assertComputeSwap({tau: 0, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 900e18, expectedY: 1100e18});
+        _assertComputeSwap({tau: 0, bond: -200e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 800e18, expectedY: 1200e18});
         // forgefmt: disable-end
     }
 
@@ -156,20 +156,20 @@ contract CfmmMathLibTest is Test {
     ///      The borrower sells bonds to the pool and receives cash.
     function test_computeSwap_borrow_matchesPythonOutput() public pure {
         // forgefmt: disable-start
-        _assertComputeSwap({tau: 1 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1049.8521564535633e18, expectedY: 950.0075328319917e18});
-        _assertComputeSwap({tau: 1 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1099.68990028024e18, expectedY: 900.0219230632409e18});
-        _assertComputeSwap({tau: 30 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1045.7495210556042e18, expectedY: 950.2236514227959e18});
-        _assertComputeSwap({tau: 30 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1091.112434534394e18, expectedY: 900.6430583197739e18});
-        _assertComputeSwap({tau: 91 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1038.1501373114986e18, expectedY: 950.6658219626787e18});
-        _assertComputeSwap({tau: 91 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1075.364633917001e18, expectedY: 901.8695265384072e18});
-        _assertComputeSwap({tau: 182 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1028.8707956005442e18, expectedY: 951.3027595497379e18});
-        _assertComputeSwap({tau: 182 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1056.3793316092308e18, expectedY: 903.5447517664321e18});
-        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1015.3075784275518e18, expectedY: 952.5343680980479e18});
-        _assertComputeSwap({tau: 365 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1029.1020184465444e18, expectedY: 906.5494585438335e18});
-        _assertComputeSwap({tau: 730 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 999.4793577002337e18, expectedY: 954.8854672802007e18});
-        _assertComputeSwap({tau: 730 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 997.9626388849459e18, expectedY: 911.7630875914437e18});
-        _assertComputeSwap({tau: 1825 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 983.0931957719121e18, expectedY: 961.2769447688811e18});
-        _assertComputeSwap({tau: 1825 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 966.5042575076678e18, expectedY: 924.6389918425044e18});
+        _assertComputeSwap({tau: 1 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1049.8521564535633e18, expectedY: 950.0075328319908e18});
+        _assertComputeSwap({tau: 1 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1099.6899002802402e18, expectedY: 900.0219230632407e18});
+        _assertComputeSwap({tau: 30 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1045.749521055607e18, expectedY: 950.2236514227952e18});
+        _assertComputeSwap({tau: 30 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1091.1124345343937e18, expectedY: 900.643058319774e18});
+        _assertComputeSwap({tau: 91 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1038.1501373114968e18, expectedY: 950.6658219626767e18});
+        _assertComputeSwap({tau: 91 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1075.3646339169986e18, expectedY: 901.8695265384083e18});
+        _assertComputeSwap({tau: 182 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1028.8707956005442e18, expectedY: 951.3027595497367e18});
+        _assertComputeSwap({tau: 182 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1056.379331609232e18, expectedY: 903.5447517664322e18});
+        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1015.3075784275504e18, expectedY: 952.5343680980483e18});
+        _assertComputeSwap({tau: 365 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1029.102018446544e18, expectedY: 906.5494585438349e18});
+        _assertComputeSwap({tau: 730 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 999.4793577002331e18, expectedY: 954.8854672802009e18});
+        _assertComputeSwap({tau: 730 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 997.9626388849464e18, expectedY: 911.7630875914448e18});
+        _assertComputeSwap({tau: 1825 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 983.0931957719125e18, expectedY: 961.2769447688815e18});
+        _assertComputeSwap({tau: 1825 days, bond: 100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 966.5042575076669e18, expectedY: 924.6389918425035e18});
         // forgefmt: disable-end
     }
 
@@ -181,20 +181,20 @@ contract CfmmMathLibTest is Test {
     ///      The lender buys bonds from the pool and pays cash.
     function test_computeSwap_lend_matchesPythonOutput() public pure {
         // forgefmt: disable-start
-        _assertComputeSwap({tau: 1 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 950.1341826407794e18, expectedY: 1049.9993088343065e18});
-        _assertComputeSwap({tau: 1 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 900.2553193011065e18, expectedY: 1100.0054778918895e18});
-        _assertComputeSwap({tau: 30 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 953.8807138468524e18, expectedY: 1049.9728040204502e18});
-        _assertComputeSwap({tau: 30 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 907.4053146105331e18, expectedY: 1100.143696915925e18});
-        _assertComputeSwap({tau: 91 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 960.9397699927628e18, expectedY: 1049.8798745474649e18});
-        _assertComputeSwap({tau: 91 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 920.989012141357e18, expectedY: 1100.3157236367474e18});
-        _assertComputeSwap({tau: 182 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 969.7761466044573e18, expectedY: 1049.6627756084063e18});
-        _assertComputeSwap({tau: 182 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 938.2016734083735e18, expectedY: 1100.321889925112e18});
-        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 983.141137563054e18, expectedY: 1049.0170497085714e18});
-        _assertComputeSwap({tau: 365 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 964.6855966029467e18, expectedY: 1099.6650771828238e18});
-        _assertComputeSwap({tau: 730 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 999.4547526394413e18, expectedY: 1047.2463120404493e18});
-        _assertComputeSwap({tau: 730 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 997.7652450541325e18, expectedY: 1096.7811445303978e18});
-        _assertComputeSwap({tau: 1825 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1017.2304306284312e18, expectedY: 1040.9907165288726e18});
-        _assertComputeSwap({tau: 1825 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1034.789673060005e18, expectedY: 1084.4550957407591e18});
+        _assertComputeSwap({tau: 1 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 950.1341826407787e18, expectedY: 1049.9993088343042e18});
+        _assertComputeSwap({tau: 1 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 900.2553193011055e18, expectedY: 1100.005477891889e18});
+        _assertComputeSwap({tau: 30 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 953.880713846854e18, expectedY: 1049.9728040204507e18});
+        _assertComputeSwap({tau: 30 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 907.4053146105344e18, expectedY: 1100.1436969159242e18});
+        _assertComputeSwap({tau: 91 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 960.9397699927622e18, expectedY: 1049.8798745474642e18});
+        _assertComputeSwap({tau: 91 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 920.9890121413562e18, expectedY: 1100.315723636747e18});
+        _assertComputeSwap({tau: 182 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 969.7761466044562e18, expectedY: 1049.6627756084047e18});
+        _assertComputeSwap({tau: 182 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 938.2016734083728e18, expectedY: 1100.3218899251106e18});
+        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 983.1411375630538e18, expectedY: 1049.0170497085721e18});
+        _assertComputeSwap({tau: 365 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 964.6855966029462e18, expectedY: 1099.6650771828247e18});
+        _assertComputeSwap({tau: 730 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 999.4547526394415e18, expectedY: 1047.246312040449e18});
+        _assertComputeSwap({tau: 730 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 997.765245054132e18, expectedY: 1096.7811445303973e18});
+        _assertComputeSwap({tau: 1825 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1017.2304306284315e18, expectedY: 1040.9907165288732e18});
+        _assertComputeSwap({tau: 1825 days, bond: -100e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1034.7896730600053e18, expectedY: 1084.4550957407598e18});
         // forgefmt: disable-end
     }
 
@@ -205,12 +205,12 @@ contract CfmmMathLibTest is Test {
     /// @dev Trade outcomes should differ when initial ψ (X/y ratio) varies.
     function test_computeSwap_psiVariations_matchesPythonOutput() public pure {
         // forgefmt: disable-start
-        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 500e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 532.2434608179561e18, expectedY: 934.0056388716611e18});
-        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 500e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 463.8659207455416e18, expectedY: 1070.6660179649916e18});
-        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1015.3075784275518e18, expectedY: 952.5343680980479e18});
-        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 983.141137563054e18, expectedY: 1049.0170497085714e18});
-        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 2000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1999.6115623980004e18, expectedY: 966.186710872931e18});
-        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 2000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1999.613031745858e18, expectedY: 1034.3948294253798e18});
+        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 500e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 532.2434608179555e18, expectedY: 934.005638871661e18});
+        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 500e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 463.86592074554153e18, expectedY: 1070.666017964992e18});
+        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1015.3075784275504e18, expectedY: 952.5343680980483e18});
+        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 983.1411375630538e18, expectedY: 1049.0170497085721e18});
+        _assertComputeSwap({tau: 365 days, bond: 50e18, X: 2000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1999.6115623980008e18, expectedY: 966.1867108729317e18});
+        _assertComputeSwap({tau: 365 days, bond: -50e18, X: 2000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1999.6130317458562e18, expectedY: 1034.3948294253803e18});
         // forgefmt: disable-end
     }
 
@@ -221,10 +221,10 @@ contract CfmmMathLibTest is Test {
     /// @dev Significant slippage should occur when trades exceed 20% of pool size.
     function test_computeSwap_largeTrades_matchesPythonOutput() public pure {
         // forgefmt: disable-start
-        _assertComputeSwap({tau: 365 days, bond: 300e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1069.697349770659e18, expectedY: 736.2503063495396e18});
-        _assertComputeSwap({tau: 365 days, bond: -300e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 873.6705075306556e18, expectedY: 1320.5652030320837e18});
-        _assertComputeSwap({tau: 365 days, bond: 500e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1087.660150792781e18, expectedY: 585.6175537989936e18});
-        _assertComputeSwap({tau: 365 days, bond: -500e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 750.5876157913261e18, expectedY: 1577.7159262149453e18});
+        _assertComputeSwap({tau: 365 days, bond: 300e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1069.6973497706579e18, expectedY: 736.2503063495393e18});
+        _assertComputeSwap({tau: 365 days, bond: -300e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 873.6705075306542e18, expectedY: 1320.5652030320823e18});
+        _assertComputeSwap({tau: 365 days, bond: 500e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 1087.6601507927803e18, expectedY: 585.6175537989942e18});
+        _assertComputeSwap({tau: 365 days, bond: -500e18, X: 1000e18, y: 1000e18, psiMin: 0.1e18, psiMax: 10e18, expectedX: 750.5876157913258e18, expectedY: 1577.7159262149476e18});
         // forgefmt: disable-end
     }
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["nelson-siegel-svensson>=0.5.0"]
+# dependencies = []
 # ///
 """
 Generate test values for CfmmMathLib.computeSwap.
@@ -19,8 +19,7 @@ Special cases:
   - τ=0: α=1, K=1, price=1 (settlement)
 """
 import math
-
-from nelson_siegel_svensson import NelsonSiegelCurve
+import sys
 
 # Constants (matching Solidity tests)
 SECONDS_PER_YEAR = 365 * 24 * 3600
@@ -32,120 +31,120 @@ BETA2 = 0.01  # 1%
 LAMBDA_YEARS = 2.0  # 2 years
 KAPPA = 0.5
 
+LOG2_E = 1 / math.log(2)  # log2(e), converts natural logs to base 2
 
-# Nelson-Siegel curve instance
-NS_CURVE = NelsonSiegelCurve(BETA0, BETA1, BETA2, LAMBDA_YEARS)
+# Error codes returned by compute_swap
+OK = 0
+INVARIANT_VIOLATED = 1
+RATE_OUT_OF_BOUNDS = 2
+ERROR_NAMES = {INVARIANT_VIOLATED: "InvariantViolated", RATE_OUT_OF_BOUNDS: "RateOutOfBounds"}
 
 
-def compute_rstar(tau_seconds: int) -> float:
-    """Nelson-Siegel anchor rate r*(tau)."""
-    if tau_seconds == 0:
+def ns_rstar(tau_years: float) -> float:
+    """Nelson-Siegel anchor rate r*(tau), with r*(0) = beta0 + beta1."""
+    if tau_years == 0:
         return BETA0 + BETA1
-    tau_years = tau_seconds / SECONDS_PER_YEAR
-    return NS_CURVE(tau_years)
-
-
-def compute_rtot(X: float, y: float, tau_seconds: int) -> float:
-    """Total rate r_tot = kappa * ln(X/y) + r*(tau)."""
-    psi = X / y
-    rstar = compute_rstar(tau_seconds)
-    return KAPPA * math.log(psi) + rstar
+    u = tau_years / LAMBDA_YEARS
+    neg_e = math.expm1(-u)
+    f1 = -neg_e / u
+    f2 = f1 - (1 + neg_e)
+    return BETA0 + BETA1 * f1 + BETA2 * f2
 
 
-def compute_price(tau_seconds: int, X: float, y: float) -> float:
-    """Price p(tau) = exp(-r_tot * tau_years)."""
+def compute_tau_params(tau_seconds: float) -> tuple[float, float, float, float, float]:
+    """Terms that only depend on tau. Returns (tau_years, alpha, 1/alpha, K, r*)."""
+    # tau=0: alpha=1, K=1 (settlement)
     if tau_seconds == 0:
-        return 1.0
-    rtot = compute_rtot(X, y, tau_seconds)
-    tau_years = tau_seconds / SECONDS_PER_YEAR
-    return math.exp(-rtot * tau_years)
-
-
-def compute_alpha(tau_seconds: int) -> float:
-    """alpha(tau) = 1 / (1 + kappa * tau_years)."""
-    if tau_seconds == 0:
-        return 1.0
-    tau_years = tau_seconds / SECONDS_PER_YEAR
-    return 1 / (1 + KAPPA * tau_years)
+        return 0.0, 1.0, 1.0, 1.0, BETA0 + BETA1
 
-
-def compute_K(tau_seconds: int) -> float:
-    """K(tau) = exp(-tau_years * r* * alpha)."""
-    if tau_seconds == 0:
-        return 1.0
-    rstar = compute_rstar(tau_seconds)
-    alpha = compute_alpha(tau_seconds)
     tau_years = tau_seconds / SECONDS_PER_YEAR
-    return math.exp(-tau_years * rstar * alpha)
+    rstar = ns_rstar(tau_years)
+    # alpha = 1 / (1 + kappa * tau_years), so 1/alpha needs no division
+    inv_alpha = 1 + KAPPA * tau_years
+    alpha = 1 / inv_alpha
+    K = math.exp(-tau_years * rstar * alpha)
+    return tau_years, alpha, inv_alpha, K, rstar
 
 
-def compute_swap(
-    tau_seconds: int,
+def compute_swap_core(
     bond_amount_signed: float,
     X: float,
     y: float,
     psi_min: float,
     psi_max: float,
-) -> tuple[float, float] | tuple[str, str]:
-    """Compute CFMM swap. Returns (XNew, yNew) or error tuple."""
-    # tau=0 shortcut
-    if tau_seconds == 0:
-        x = X
-        x_new = x + bond_amount_signed
+    tau_params: tuple[float, float, float, float, float],
+) -> tuple[float, float, int]:
+    """Compute CFMM swap given precomputed tau terms. Returns (XNew, yNew, error code)."""
+    tau_years, alpha, inv_alpha, K, rstar = tau_params
+
+    # tau=0 shortcut: alpha=1 makes the invariant linear and
+    # X_new = ((y / y_new) * (psi + 1) - 1) * y_new reduces to X + y - y_new
+    if tau_years == 0:
         y_new = y - bond_amount_signed
-
-        psi = X / y
-        ratio = y / y_new
-        alpha = 1.0
-        psi_new = (ratio**alpha) * (psi + 1) - 1
-        X_new = psi_new * y_new
-
-        # Check psi bounds
+        X_new = X + bond_amount_signed
+        psi_new = X_new / y_new
         if psi_new < psi_min or psi_new > psi_max:
-            return ("ERROR", "RateOutOfBounds")
-
-        return (X_new, y_new)
+            return 0.0, 0.0, RATE_OUT_OF_BOUNDS
+        return X_new, y_new, OK
 
     # Normal case: tau > 0
-    price = compute_price(tau_seconds, X, y)
-    x = X / price
+    psi = X / y
+    # Powers are evaluated as exp2(a * log2(b))
+    log2_y = math.log2(y)
 
-    alpha = compute_alpha(tau_seconds)
-    K = compute_K(tau_seconds)
+    log_psi = math.log(psi)
+    rtot = KAPPA * log_psi + rstar
 
-    C = K * (x**alpha) + (y**alpha)
+    # x = X / p(tau) = y * psi * exp(rtot * tau), so log2(x) follows from log2(y) and ln(psi)
+    log2_x = log2_y + (log_psi + rtot * tau_years) * LOG2_E
+    x = math.exp2(log2_x)
+    y_alpha = math.exp2(alpha * log2_y)
+    C = K * math.exp2(alpha * log2_x) + y_alpha
 
     x_new = x + bond_amount_signed
     if x_new <= 0:
-        return ("ERROR", "InvariantViolated")
+        return 0.0, 0.0, INVARIANT_VIOLATED
 
-    x_new_alpha = math.pow(x_new, alpha)
-    y_alpha_new = C - K * x_new_alpha
+    y_alpha_new = C - K * math.exp2(alpha * math.log2(x_new))
     if y_alpha_new <= 0:
-        return ("ERROR", "InvariantViolated")
+        return 0.0, 0.0, INVARIANT_VIOLATED
 
-    y_new = math.pow(y_alpha_new, 1 / alpha)
+    y_new = math.exp2(inv_alpha * math.log2(y_alpha_new))
 
-    psi = X / y
-    ratio = y / y_new
-    psi_new = (ratio**alpha) * (psi + 1) - 1
+    # ratio^alpha = (y / y_new)^alpha = y^alpha / y_new^alpha, both already known
+    ratio_alpha = y_alpha / y_alpha_new
+    psi_new = ratio_alpha * (psi + 1) - 1
     X_new = psi_new * y_new
 
     # Check psi bounds
     if psi_new < psi_min or psi_new > psi_max:
-        return ("ERROR", "RateOutOfBounds")
+        return 0.0, 0.0, RATE_OUT_OF_BOUNDS
+
+    return X_new, y_new, OK
 
-    return (X_new, y_new)
 
+def print_cases(sections: list[tuple[str, list[tuple[int, float, float, float, float, float]]]]) -> None:
+    """Evaluate every test case and print them grouped by section."""
+    cases = [case for _, section_cases in sections for case in section_cases]
 
-def print_case(tau: int, bond: float, X: float, y: float, psi_min: float, psi_max: float) -> None:
-    """Print a single test case with float values."""
-    result = compute_swap(tau, bond, X, y, psi_min, psi_max)
-    if result[0] == "ERROR":
-        print(f"  tau={tau}, bond={bond}, X={X}, y={y}, psiMin={psi_min}, psiMax={psi_max} => {result[1]}")
-    else:
-        X_new, y_new = result
-        print(f"  tau={tau}, bond={bond}, X={X}, y={y}, psiMin={psi_min}, psiMax={psi_max} => XNew={X_new}, yNew={y_new}")
+    # Many cases share a maturity: compute the tau-only terms once per distinct tau
+    tau_table = {tau: compute_tau_params(tau) for tau in {case[0] for case in cases}}
+    results = iter([
+        compute_swap_core(bond, X, y, psi_min, psi_max, tau_table[tau])
+        for tau, bond, X, y, psi_min, psi_max in cases
+    ])
+
+    lines = []
+    for title, section_cases in sections:
+        lines.append(title)
+        for (tau, bond, X, y, psi_min, psi_max), (X_new, y_new, code) in zip(section_cases, results):
+            prefix = f"  tau={tau}, bond={bond}, X={X}, y={y}, psiMin={psi_min}, psiMax={psi_max} =>"
+            if code != OK:
+                lines.append(f"{prefix} {ERROR_NAMES[code]}")
+            else:
+                lines.append(f"{prefix} XNew={X_new}, yNew={y_new}")
+    # Emit the whole table with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -166,61 +165,76 @@ def main() -> None:
     print("CfmmMathLib.computeSwap TEST CASES")
     print("=" * 70)
 
+    sections = []
+
     # ═══════════════════════════════════════════════════════════════════════
     # τ=0 (Settlement)
     # At τ=0, α=1, K=1, price=1 → linear invariant, cash = bondAmount
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 1: tau=0 (settlement, price=1) ===")
-    for bond in [100, 200, -100, -200]:
-        print_case(0, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX)
+    sections.append((
+        "\n=== Category 1: tau=0 (settlement, price=1) ===",
+        [(0, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX) for bond in [100, 200, -100, -200]],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Borrow (bondAmount > 0)
     # X increases, y decreases
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 2: Borrow (bondAmount > 0) ===")
-    for tau in STANDARD_TAUS:
-        for bond in [50, 100]:
-            print_case(tau, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX)
+    sections.append((
+        "\n=== Category 2: Borrow (bondAmount > 0) ===",
+        [(tau, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX) for tau in STANDARD_TAUS for bond in [50, 100]],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Lend (bondAmount < 0)
     # X decreases, y increases
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 3: Lend (bondAmount < 0) ===")
-    for tau in STANDARD_TAUS:
-        for bond in [-50, -100]:
-            print_case(tau, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX)
+    sections.append((
+        "\n=== Category 3: Lend (bondAmount < 0) ===",
+        [(tau, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX) for tau in STANDARD_TAUS for bond in [-50, -100]],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Psi Variations
     # Same trade with different initial X/y ratios
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 4: Psi variations ===")
-    for X, y in [(500, 1000), (1000, 1000), (2000, 1000)]:  # psi = 0.5, 1.0, 2.0
-        for bond in [50, -50]:
-            print_case(YEAR, bond, X, y, PSI_MIN, PSI_MAX)
+    sections.append((
+        "\n=== Category 4: Psi variations ===",
+        [
+            (YEAR, bond, X, y, PSI_MIN, PSI_MAX)
+            for X, y in [(500, 1000), (1000, 1000), (2000, 1000)]  # psi = 0.5, 1.0, 2.0
+            for bond in [50, -50]
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Large Trades (slippage)
     # Trades > 20% of pool
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 5: Large trades (slippage) ===")
-    for bond in [300, -300]:  # 30% of pool
-        print_case(YEAR, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX)
-    for bond in [500, -500]:  # 50% of pool
-        print_case(YEAR, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX)
+    sections.append((
+        "\n=== Category 5: Large trades (slippage) ===",
+        [
+            (YEAR, bond, X_DEFAULT, Y_DEFAULT, PSI_MIN, PSI_MAX)
+            for bond in [300, -300, 500, -500]  # 30% and 50% of pool
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Error Cases (RateOutOfBounds)
     # Trades that push psi outside bounds
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 6: Error cases (RateOutOfBounds) ===")
     # Tight bounds to trigger error
     TIGHT_PSI_MIN = 0.9
     TIGHT_PSI_MAX = 1.1
-    for bond in [400, -400]:  # Large trades with tight bounds
-        print_case(YEAR, bond, X_DEFAULT, Y_DEFAULT, TIGHT_PSI_MIN, TIGHT_PSI_MAX)
+    sections.append((
+        "\n=== Category 6: Error cases (RateOutOfBounds) ===",
+        [
+            (YEAR, bond, X_DEFAULT, Y_DEFAULT, TIGHT_PSI_MIN, TIGHT_PSI_MAX)
+            for bond in [400, -400]  # Large trades with tight bounds
+        ],
+    ))
+
+    print_cases(sections)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["nelson-siegel-svensson>=0.5.0"]
+# dependencies = ["numpy>=1.26"]
 # ///
 """
 Generate test values for NelsonSiegelLib.computeRStar.
@@ -15,117 +15,157 @@ Special cases:
   - τ=0: r* = β₀ + β₁ (instant rate)
   - τ/λ < 0.01: Taylor approximation f₁ ≈ 1 - (τ/λ)/2
 """
-from nelson_siegel_svensson import NelsonSiegelCurve
+import sys
 
+import numpy as np
 
-def compute_rstar(tau: float, beta0: float, beta1: float, beta2: float, lambda_: float) -> float:
-    """Compute r*(τ) using Nelson-Siegel curve."""
-    if tau == 0:
-        return beta0 + beta1
-    curve = NelsonSiegelCurve(beta0, beta1, beta2, lambda_)
-    return curve(tau)
 
+def rstar_batch(tau: np.ndarray, beta0: float, beta1: float, beta2: float, lambda_: float) -> np.ndarray:
+    """Compute r*(τ) over an array of maturities using the closed-form Nelson-Siegel curve."""
+    u = tau / lambda_
+    # expm1 keeps 1 - e^(-u) exact for small u, so no Taylor branch is needed; only τ=0 (f₁=1) is special
+    neg_e = np.expm1(-u)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f1 = np.where(u == 0, 1.0, -neg_e / u)
+    f2 = f1 - (1 + neg_e)
+    return beta0 + beta1 * f1 + beta2 * f2
 
-def print_case(tau: float, beta0: float, beta1: float, beta2: float, lambda_: float) -> None:
-    """Print a single test case."""
-    expected = compute_rstar(tau, beta0, beta1, beta2, lambda_)
-    print(f"  tau={tau}, beta0={beta0}, beta1={beta1}, beta2={beta2}, lambda={lambda_} => {expected}")
+
+def print_cases(sections: list[tuple[str, list[tuple[float, float, float, float, float]]]]) -> None:
+    """Evaluate every test case in a single batch and print them grouped by section."""
+    cases = [case for _, section_cases in sections for case in section_cases]
+
+    table = np.asarray(cases, dtype=np.float64)
+    taus, params = table[:, 0], table[:, 1:]
+
+    # Evaluate the curve once per distinct (beta0, beta1, beta2, lambda) over all of its maturities
+    curves, curve_index = np.unique(params, axis=0, return_inverse=True)
+    curve_index = curve_index.reshape(-1)
+
+    expected = np.empty(len(cases), dtype=np.float64)
+    for k, curve in enumerate(curves.tolist()):
+        in_curve = curve_index == k
+        expected[in_curve] = rstar_batch(taus[in_curve], *curve)
+
+    # Convert back to Python floats in bulk rather than element by element
+    results = iter(expected.tolist())
+    lines = []
+    for title, section_cases in sections:
+        lines.append(title)
+        for (tau, beta0, beta1, beta2, lambda_), rstar in zip(section_cases, results):
+            lines.append(f"  tau={tau}, beta0={beta0}, beta1={beta1}, beta2={beta2}, lambda={lambda_} => {rstar}")
+    # Emit the whole table with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
     # Standard maturities (in years) - matches Solidity day counts
     STANDARD_TAUS = [1/365, 7/365, 30/365, 91/365, 182/365, 1, 2, 5, 10, 30]
 
+    sections = []
+
     # ═══════════════════════════════════════════════════════════════════════
     # τ=0 (Instant Rate)
     # At τ=0, f₁→1, f₂→0, so r* = β₀ + β₁
     # ═══════════════════════════════════════════════════════════════════════
-    print("=== Category 1: tau=0 (r* = beta0 + beta1) ===")
-    for beta0, beta1, beta2, lambda_ in [
-        (0.05, -0.02, 0.01, 2),
-        (0.10, 0, 0, 1),
-        (0.03, 0.02, -0.01, 1),
-        (0.08, -0.05, 0.03, 3),
-        (0.02, 0.01, 0, 1),
-    ]:
-        print_case(0, beta0, beta1, beta2, lambda_)
+    sections.append((
+        "=== Category 1: tau=0 (r* = beta0 + beta1) ===",
+        [
+            (0, beta0, beta1, beta2, lambda_)
+            for beta0, beta1, beta2, lambda_ in [
+                (0.05, -0.02, 0.01, 2),
+                (0.10, 0, 0, 1),
+                (0.03, 0.02, -0.01, 1),
+                (0.08, -0.05, 0.03, 3),
+                (0.02, 0.01, 0, 1),
+            ]
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Flat Curve (β₁=β₂=0)
     # r*(τ) = β₀ for all maturities
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 2: Flat curve (beta1=beta2=0) ===")
-    for tau in STANDARD_TAUS:
-        print_case(tau, 0.05, 0, 0, 2)
+    sections.append((
+        "\n=== Category 2: Flat curve (beta1=beta2=0) ===",
+        [(tau, 0.05, 0, 0, 2) for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Normal Curve (β₁ < 0)
     # Upward sloping: short rates < long rates
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 3: Normal curve (beta1 < 0) ===")
-    for beta0 in [0.03, 0.05, 0.08]:
-        for tau in STANDARD_TAUS:
-            print_case(tau, beta0, -0.02, 0.01, 2)
+    sections.append((
+        "\n=== Category 3: Normal curve (beta1 < 0) ===",
+        [(tau, beta0, -0.02, 0.01, 2) for beta0 in [0.03, 0.05, 0.08] for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Inverted Curve (β₁ > 0)
     # Downward sloping: short rates > long rates
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 4: Inverted curve (beta1 > 0) ===")
-    for beta1 in [0.01, 0.02]:
-        for tau in STANDARD_TAUS:
-            print_case(tau, 0.05, beta1, -0.01, 1)
+    sections.append((
+        "\n=== Category 4: Inverted curve (beta1 > 0) ===",
+        [(tau, 0.05, beta1, -0.01, 1) for beta1 in [0.01, 0.02] for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Curvature Effects (β₂ ≠ 0)
     # Medium-term hump (β₂ > 0) or trough (β₂ < 0)
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 5: Curvature effects ===")
-    for beta2 in [0.02, 0.03]:
-        for tau in STANDARD_TAUS:
-            print_case(tau, 0.05, 0, beta2, 2)
+    sections.append((
+        "\n=== Category 5: Curvature effects ===",
+        [(tau, 0.05, 0, beta2, 2) for beta2 in [0.02, 0.03] for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Lambda Variations
     # Controls decay speed of β₁ and β₂ influence
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 6: Lambda variations ===")
-    for lambda_ in [0.5, 1, 2, 3, 5]:
-        for tau in [1, 2, 5]:
-            print_case(tau, 0.05, -0.02, 0.01, lambda_)
+    sections.append((
+        "\n=== Category 6: Lambda variations ===",
+        [(tau, 0.05, -0.02, 0.01, lambda_) for lambda_ in [0.5, 1, 2, 3, 5] for tau in [1, 2, 5]],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Large τ (Asymptotic Behavior)
     # As τ→∞, f₁→0, f₂→0, so r*→β₀
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 7: Edge cases (large tau) ===")
-    for tau in [20, 30, 50, 100]:
-        print_case(tau, 0.05, -0.02, 0.01, 2)
+    sections.append((
+        "\n=== Category 7: Edge cases (large tau) ===",
+        [(tau, 0.05, -0.02, 0.01, 2) for tau in [20, 30, 50, 100]],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Small τ/λ Ratio (Taylor Branch)
     # When τ/λ < 0.01, code uses approximation f₁ ≈ 1 - (τ/λ)/2
     # With λ=2yr, τ<7.3 days enters this branch
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 8: Small tau/lambda ratio (Taylor approximation) ===")
-    for tau_days, lambda_years in [(1, 2), (3, 2), (7, 2), (1, 5), (3, 5)]:
-        tau = tau_days / 365
-        print_case(tau, 0.05, -0.02, 0.01, lambda_years)
+    sections.append((
+        "\n=== Category 8: Small tau/lambda ratio (Taylor approximation) ===",
+        [
+            (tau_days / 365, 0.05, -0.02, 0.01, lambda_years)
+            for tau_days, lambda_years in [(1, 2), (3, 2), (7, 2), (1, 5), (3, 5)]
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Negative Rates
     # Tests: (a) β₀ < 0 (negative long rate), (b) β₀ + β₁ < 0 (negative instant)
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 9: Negative rates ===")
+    sections.append(("\n=== Category 9: Negative rates ===", []))
     # β₀ < 0 (negative long rate)
-    print("  # beta0 < 0 (negative long rate)")
-    for tau in [0, 1, 5]:
-        print_case(tau, -0.01, 0.02, 0, 2)
-
+    sections.append((
+        "  # beta0 < 0 (negative long rate)",
+        [(tau, -0.01, 0.02, 0, 2) for tau in [0, 1, 5]],
+    ))
     # β₀ + β₁ < 0 (negative instant rate)
-    print("  # beta0 + beta1 < 0 (negative instant rate)")
-    for tau in [0, 1, 5]:
-        print_case(tau, 0.01, -0.03, 0, 2)
+    sections.append((
+        "  # beta0 + beta1 < 0 (negative instant rate)",
+        [(tau, 0.01, -0.03, 0, 2) for tau in [0, 1, 5]],
+    ))
+
+    print_cases(sections)
 
 
 if __name__ == "__main__":
@@ -16,23 +16,40 @@ Special cases:
   - τ→∞: φ→1, so w_b→(1-η_b), w_l→(1+η_l)
 """
 import math
+import sys
+from itertools import product
+
+# τ/λ above which -expm1(-τ/λ) evaluates to exactly 1.0 (it first does at ln(2^54) ≈ 37.43)
+PHI_SATURATION_RATIO = 38.0
+
+# Output lines, written to stdout in one go at the end of main()
+_out: list[str] = []
+
+# Pre-bound line formatter for computeBaseEquity cases
+_BASE_EQUITY_FMT = "  yLiq={}, yPnl={}, yVault={}, wVault={}, sPast={} => {}".format
+
+
+def _phi_from_ratio(u: float) -> float:
+    """Compute φ = 1 - e^(-u) for u = τ/λ as -expm1(-u), exact for small u and 0 at u=0."""
+    # Past PHI_SATURATION_RATIO, -expm1(-u) is exactly 1.0, so skipping it changes no result
+    if u > PHI_SATURATION_RATIO:
+        return 1.0
+    return -math.expm1(-u)
 
 
 def compute_phi(tau: float, lambda_: float) -> float:
     """Compute φ(τ) = 1 - e^(-τ/λ)."""
-    if tau == 0:
-        return 0.0
-    return 1 - math.exp(-tau / lambda_)
+    return _phi_from_ratio(tau / lambda_)
+
+
+def compute_phi_unit_lambda(tau: float) -> float:
+    """Compute φ(τ) for λ=1, where τ/λ = τ needs no division."""
+    return _phi_from_ratio(tau)
 
 
-def compute_weighted_net(tau: float, b: float, l: float, lambda_: float, eta_b: float, eta_l: float) -> float:
-    """Compute weighted net = w_b·b - w_l·l."""
-    if tau == 0:
-        return b - l
-    phi = compute_phi(tau, lambda_)
-    w_b = 1 - eta_b * phi
-    w_l = 1 + eta_l * phi
-    return w_b * b - w_l * l
+def compute_weighted_net(b: float, l: float, phi: float, eta_b: float, eta_l: float) -> float:
+    """Compute weighted net = w_b·b - w_l·l, fused as b - l - φ·(η_b·b + η_l·l)."""
+    return b - l - phi * (eta_b * b + eta_l * l)
 
 
 def compute_base_equity(y_liq: float, y_pnl: float, y_vault: float, w_vault: float, s_past: float) -> float:
@@ -40,136 +57,187 @@ def compute_base_equity(y_liq: float, y_pnl: float, y_vault: float, w_vault: flo
     return y_liq + y_pnl + w_vault * y_vault + s_past
 
 
-def print_weighted_net(tau: float, b: float, l: float, lambda_: float, eta_b: float, eta_l: float) -> None:
-    """Print a computeWeightedNet test case."""
-    expected = compute_weighted_net(tau, b, l, lambda_, eta_b, eta_l)
-    print(f"  tau={tau}, b={b}, l={l}, lambda={lambda_}, etaB={eta_b}, etaL={eta_l} => {expected}")
-
-
-def print_base_equity(y_liq: float, y_pnl: float, y_vault: float, w_vault: float, s_past: float) -> None:
-    """Print a computeBaseEquity test case."""
-    expected = compute_base_equity(y_liq, y_pnl, y_vault, w_vault, s_past)
-    print(f"  yLiq={y_liq}, yPnl={y_pnl}, yVault={y_vault}, wVault={w_vault}, sPast={s_past} => {expected}")
+def print_weighted_net_cases(sections: list[tuple[str, list[tuple[float, float, float, float, float, float]]]]) -> None:
+    """Evaluate every computeWeightedNet test case and print them grouped by section."""
+    cases = [case for _, section_cases in sections for case in section_cases]
+
+    # Categories reuse the same (τ, λ) with different notionals and η: evaluate φ once per
+    # distinct pair and look each case's φ up from that table. Most categories use λ=1;
+    # only the λ variations need the general path
+    phi_table = {
+        (tau, lambda_): compute_phi_unit_lambda(tau) if lambda_ == 1 else compute_phi(tau, lambda_)
+        for tau, lambda_ in {(case[0], case[3]) for case in cases}
+    }
+    results = iter([
+        compute_weighted_net(b, l, phi_table[tau, lambda_], eta_b, eta_l)
+        for tau, b, l, lambda_, eta_b, eta_l in cases
+    ])
+    for title, section_cases in sections:
+        _out.append(title)
+        for (tau, b, l, lambda_, eta_b, eta_l), net in zip(section_cases, results):
+            if tau == 0:
+                # φ=0, so the net is exactly b - l; keep integer notionals rendered as integers
+                net = b - l
+            # repr() round-trips floats like str() but skips the format-spec machinery
+            _out.append("".join((
+                "  tau=", repr(tau), ", b=", repr(b), ", l=", repr(l),
+                ", lambda=", repr(lambda_), ", etaB=", repr(eta_b),
+                ", etaL=", repr(eta_l), " => ", repr(net),
+            )))
+
+
+def print_base_equity_cases(sections: list[tuple[str, list[tuple[float, float, float, float, float]]]]) -> None:
+    """Evaluate every computeBaseEquity test case and print them grouped by section."""
+    for title, section_cases in sections:
+        _out.append(title)
+        for case in section_cases:
+            _out.append(_BASE_EQUITY_FMT(*case, compute_base_equity(*case)))
 
 
 def main() -> None:
     # Standard maturities (in years) - matches Solidity day counts
     STANDARD_TAUS = [1/365, 7/365, 30/365, 91/365, 182/365, 1, 2, 5, 10]
 
-    print("=" * 70)
-    print("computeWeightedNet TEST CASES")
-    print("=" * 70)
+    _out.append("=" * 70)
+    _out.append("computeWeightedNet TEST CASES")
+    _out.append("=" * 70)
+
+    sections = []
 
     # ═══════════════════════════════════════════════════════════════════════
     # τ=0 (Instant Maturity)
     # At τ=0, φ=0, so w_b=1, w_l=1, net = b - l
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 1: tau=0 (phi=0, net = b - l) ===")
-    for b, l in [(100, 50), (50, 100), (100, 100), (1000, 0), (0, 1000), (500, 200), (200, 500), (1, 1)]:
-        print_weighted_net(0, b, l, 1, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 1: tau=0 (phi=0, net = b - l) ===",
+        [
+            (0, b, l, 1, 0.2, 0.1)
+            for b, l in [(100, 50), (50, 100), (100, 100), (1000, 0), (0, 1000), (500, 200), (200, 500), (1, 1)]
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # τ=λ (Characteristic Time)
     # At τ=λ, φ = 1 - e^(-1) ≈ 0.632
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 2: tau=lambda (phi ~ 0.632) ===")
-    for b, l in [(1000, 500), (500, 1000), (1000, 1000), (2000, 1000), (1000, 2000)]:
-        for eta_b, eta_l in [(0.2, 0.1), (0.1, 0.1), (0.3, 0.2)]:
-            print_weighted_net(1, b, l, 1, eta_b, eta_l)
+    sections.append((
+        "\n=== Category 2: tau=lambda (phi ~ 0.632) ===",
+        [
+            (1, b, l, 1, eta_b, eta_l)
+            for (b, l), (eta_b, eta_l) in product(
+                [(1000, 500), (500, 1000), (1000, 1000), (2000, 1000), (1000, 2000)],
+                [(0.2, 0.1), (0.1, 0.1), (0.3, 0.2)],
+            )
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # τ >> λ (Asymptotic Behavior)
     # As τ→∞, φ→1, so w_b→(1-η_b), w_l→(1+η_l)
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 3: tau >> lambda (phi -> 1) ===")
-    for tau in [10, 20, 50, 100]:
-        for b, l in [(1000, 500), (1000, 1000)]:
-            print_weighted_net(tau, b, l, 1, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 3: tau >> lambda (phi -> 1) ===",
+        [(tau, b, l, 1, 0.2, 0.1) for tau, (b, l) in product([10, 20, 50, 100], [(1000, 500), (1000, 1000)])],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Balanced b=l
     # Tests net behavior when bond and liability notionals are equal
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 4: Balanced b=l ===")
-    for tau in STANDARD_TAUS:
-        print_weighted_net(tau, 1000, 1000, 1, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 4: Balanced b=l ===",
+        [(tau, 1000, 1000, 1, 0.2, 0.1) for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # b >> l (Net Long Position)
     # Tests behavior when heavily long bonds
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 5: b >> l ===")
-    for tau in STANDARD_TAUS:
-        print_weighted_net(tau, 10000, 1000, 1, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 5: b >> l ===",
+        [(tau, 10000, 1000, 1, 0.2, 0.1) for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # b << l (Net Short Position)
     # Tests behavior when heavily short bonds
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 6: b << l ===")
-    for tau in STANDARD_TAUS:
-        print_weighted_net(tau, 1000, 10000, 1, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 6: b << l ===",
+        [(tau, 1000, 10000, 1, 0.2, 0.1) for tau in STANDARD_TAUS],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Lambda Variations
     # Controls decay speed of weight adjustments
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 7: Lambda variations ===")
-    for lambda_ in [0.5, 1, 2, 3, 5]:
-        for tau in [1, 2, 5]:
-            print_weighted_net(tau, 1000, 500, lambda_, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 7: Lambda variations ===",
+        [(tau, 1000, 500, lambda_, 0.2, 0.1) for lambda_, tau in product([0.5, 1, 2, 3, 5], [1, 2, 5])],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # Zero Notionals (Edge Cases)
     # Tests edge cases where one side is zero (requires exp calculation)
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 8: Zero notionals (edge cases) ===")
     # b=0: net = -w_l * l (only liability, negative)
     # l=0: net = w_b * b (only bonds, positive)
-    for tau in [1, 5]:
-        print_weighted_net(tau, 0, 1000, 1, 0.2, 0.1)
-        print_weighted_net(tau, 1000, 0, 1, 0.2, 0.1)
+    sections.append((
+        "\n=== Category 8: Zero notionals (edge cases) ===",
+        [case for tau in [1, 5] for case in [(tau, 0, 1000, 1, 0.2, 0.1), (tau, 1000, 0, 1, 0.2, 0.1)]],
+    ))
+
+    print_weighted_net_cases(sections)
 
-    print("\n")
-    print("=" * 70)
-    print("computeBaseEquity TEST CASES")
-    print("=" * 70)
+    _out.append("\n")
+    _out.append("=" * 70)
+    _out.append("computeBaseEquity TEST CASES")
+    _out.append("=" * 70)
+
+    sections = []
 
     # ═══════════════════════════════════════════════════════════════════════
     # wVault = 1 (Full Vault Weight)
     # E_base = yLiq + yPnl + yVault + sPast
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 1: wVault = 1 ===")
-    for y_liq, y_pnl, y_vault, w_vault, s_past in [
-        (800, 200, 500, 1.0, -100),
-        (1000, 0, 500, 1.0, 0),
-        (0, 500, 1000, 1.0, -200),
-        (5000, 1000, 2000, 1.0, 500),
-        (100, 50, 200, 1.0, -50),
-    ]:
-        print_base_equity(y_liq, y_pnl, y_vault, w_vault, s_past)
+    sections.append((
+        "\n=== Category 1: wVault = 1 ===",
+        [
+            (800, 200, 500, 1.0, -100),
+            (1000, 0, 500, 1.0, 0),
+            (0, 500, 1000, 1.0, -200),
+            (5000, 1000, 2000, 1.0, 500),
+            (100, 50, 200, 1.0, -50),
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # wVault = 0.5 (Partial Vault Weight)
     # E_base = yLiq + yPnl + 0.5·yVault + sPast
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 2: wVault = 0.5 ===")
-    for y_liq, y_pnl, y_vault, w_vault, s_past in [
-        (800, 200, 500, 0.5, -100),
-        (1000, 0, 1000, 0.5, 0),
-        (0, 500, 2000, 0.5, -200),
-        (5000, 1000, 4000, 0.5, 500),
-        (100, 50, 400, 0.5, -50),
-    ]:
-        print_base_equity(y_liq, y_pnl, y_vault, w_vault, s_past)
+    sections.append((
+        "\n=== Category 2: wVault = 0.5 ===",
+        [
+            (800, 200, 500, 0.5, -100),
+            (1000, 0, 1000, 0.5, 0),
+            (0, 500, 2000, 0.5, -200),
+            (5000, 1000, 4000, 0.5, 500),
+            (100, 50, 400, 0.5, -50),
+        ],
+    ))
 
     # ═══════════════════════════════════════════════════════════════════════
     # sPast Variations
     # Tests accumulated past income/loss component
     # ═══════════════════════════════════════════════════════════════════════
-    print("\n=== Category 3: sPast variations ===")
-    for s_past in [-1000, -500, -100, 0, 100, 500, 1000]:
-        print_base_equity(1000, 500, 500, 0.8, s_past)
+    sections.append((
+        "\n=== Category 3: sPast variations ===",
+        [(1000, 500, 500, 0.8, s_past) for s_past in [-1000, -500, -100, 0, 100, 500, 1000]],
+    ))
+
+    print_base_equity_cases(sections)
+
+    sys.stdout.write("\n".join(_out) + "\n")
 
 
 if __name__ == "__main__":